@@ -6,16 +6,38 @@ Usage: python3 benchmark_env_info.py [target_directory]
 
 import os
 import sys
+import errno
 import subprocess
 import json
 import re
 import time
 import tempfile
 import platform
+import ctypes
+import ctypes.util
+import mmap
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 
+# シーケンシャル I/O 測定の設定（1MiB × 1024 = 1GiB）
+IO_BLOCK_SIZE = 1024 * 1024
+IO_BLOCK_COUNT = 1024
+
+# io_uring のリングサイズとキュー深さ
+IO_URING_ENTRIES = 64
+IO_URING_QUEUE_DEPTH = 32
+
+# io_uring_setup(2) のフラグと SQPOLL カーネルスレッドのアイドル時間 [msec]
+IORING_SETUP_IOPOLL = 1 << 0
+IORING_SETUP_SQPOLL = 1 << 1
+IO_URING_SQ_THREAD_IDLE_MS = 2000
+
+# struct io_uring は liburing のバージョンによって中身が変わるため、十分な大きさの領域を確保する
+_IO_URING_STRUCT_SIZE = 512
+
+
 def run_command(cmd, shell=False):
   """コマンドを実行して結果を返す"""
   try:
@@ -24,7 +46,7 @@ def run_command(cmd, shell=False):
     else:
       result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
     return result.stdout.strip() if result.returncode == 0 else None
-  except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+  except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError):
     return None
 
 
@@ -183,6 +205,254 @@ def get_storage_info(target_dir):
   return info
 
 
+class _IoUringCqe(ctypes.Structure):
+  """struct io_uring_cqe"""
+  _fields_ = [
+    ('user_data', ctypes.c_uint64),
+    ('res', ctypes.c_int32),
+    ('flags', ctypes.c_uint32),
+  ]
+
+
+class _IoUringParams(ctypes.Structure):
+  """struct io_uring_params（sq_off/cq_off の中身は参照しないのでバイト列として扱う）"""
+  _fields_ = [
+    ('sq_entries', ctypes.c_uint32),
+    ('cq_entries', ctypes.c_uint32),
+    ('flags', ctypes.c_uint32),
+    ('sq_thread_cpu', ctypes.c_uint32),
+    ('sq_thread_idle', ctypes.c_uint32),
+    ('features', ctypes.c_uint32),
+    ('wq_fd', ctypes.c_uint32),
+    ('resv', ctypes.c_uint32 * 3),
+    ('sq_off', ctypes.c_uint8 * 40),
+    ('cq_off', ctypes.c_uint8 * 40),
+  ]
+
+
+class _Iovec(ctypes.Structure):
+  """struct iovec"""
+  _fields_ = [
+    ('iov_base', ctypes.c_void_p),
+    ('iov_len', ctypes.c_size_t),
+  ]
+
+
+class UringSetupError(OSError):
+  """io_uring のリングをセットアップできなかった（seccomp や io_uring_disabled など）"""
+
+
+class UringCqeError(OSError):
+  """io_uring で投入した I/O がエラーで完了した"""
+
+
+def load_liburing():
+  """liburing を ctypes でロードする（利用できない場合は None）
+
+  io_uring_get_sqe() や io_uring_prep_*() は liburing.so ではインライン関数なので、
+  それらをシンボルとしてエクスポートしている liburing-ffi を使用する。
+  """
+  candidates = ['liburing-ffi.so.2']
+  found = ctypes.util.find_library('uring-ffi')
+  if found:
+    candidates.append(found)
+
+  for name in candidates:
+    try:
+      return _bind_liburing(ctypes.CDLL(name, use_errno=True))
+    except (OSError, AttributeError):
+      continue
+  return None
+
+
+def _bind_liburing(lib):
+  """liburing の関数シグネチャを設定する"""
+  ring_p = ctypes.c_void_p
+  sqe_p = ctypes.c_void_p
+  cqe_p = ctypes.POINTER(_IoUringCqe)
+
+  lib.io_uring_queue_init_params.argtypes = [ctypes.c_uint, ring_p, ctypes.POINTER(_IoUringParams)]
+  lib.io_uring_queue_init_params.restype = ctypes.c_int
+  lib.io_uring_queue_exit.argtypes = [ring_p]
+  lib.io_uring_queue_exit.restype = None
+  lib.io_uring_get_sqe.argtypes = [ring_p]
+  lib.io_uring_get_sqe.restype = sqe_p
+  for prep in (lib.io_uring_prep_write, lib.io_uring_prep_read):
+    prep.argtypes = [sqe_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint64]
+    prep.restype = None
+  for prep in (lib.io_uring_prep_write_fixed, lib.io_uring_prep_read_fixed):
+    prep.argtypes = [sqe_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_uint64, ctypes.c_int]
+    prep.restype = None
+  lib.io_uring_register_buffers.argtypes = [ring_p, ctypes.POINTER(_Iovec), ctypes.c_uint]
+  lib.io_uring_register_buffers.restype = ctypes.c_int
+  lib.io_uring_submit.argtypes = [ring_p]
+  lib.io_uring_submit.restype = ctypes.c_int
+  lib.io_uring_wait_cqe_nr.argtypes = [ring_p, ctypes.POINTER(cqe_p), ctypes.c_uint]
+  lib.io_uring_wait_cqe_nr.restype = ctypes.c_int
+  lib.io_uring_peek_batch_cqe.argtypes = [ring_p, ctypes.POINTER(cqe_p), ctypes.c_uint]
+  lib.io_uring_peek_batch_cqe.restype = ctypes.c_uint
+  lib.io_uring_cq_advance.argtypes = [ring_p, ctypes.c_uint]
+  lib.io_uring_cq_advance.restype = None
+  return lib
+
+
+def uring_sequential_io(lib, path, write):
+  """io_uring + O_DIRECT でシーケンシャル I/O を行い、(スループット [bytes/s], 測定方式) を返す
+
+  まず SQPOLL + IOPOLL のリングで測定し、リングをセットアップできない場合や
+  ポーリング非対応のデバイスで I/O が失敗した場合は通常の割り込み駆動のリングで測定し直す。
+  """
+  try:
+    speed, buffer_mode = _uring_sequential_io(lib, path, write, IORING_SETUP_SQPOLL | IORING_SETUP_IOPOLL)
+    return speed, f"SQPOLL+IOPOLL, {buffer_mode}"
+  except UringSetupError:
+    pass
+  except UringCqeError as e:
+    # IOPOLL 非対応のデバイスでは EOPNOTSUPP、5.11 より前のカーネルの SQPOLL は
+    # 登録していないファイルに対して EBADF になる
+    if e.errno not in (errno.EOPNOTSUPP, errno.EBADF):
+      raise
+  speed, buffer_mode = _uring_sequential_io(lib, path, write, 0)
+  return speed, f"interrupt-driven, {buffer_mode}"
+
+
+def _uring_sequential_io(lib, path, write, setup_flags):
+  """指定したフラグで io_uring をセットアップしてシーケンシャル I/O を行う"""
+  if write:
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT
+  else:
+    flags = os.O_RDONLY | os.O_DIRECT
+  fd = os.open(path, flags, 0o644)
+  try:
+    # mmap の領域はページ境界に揃っているので O_DIRECT のバッファとしてそのまま使える
+    buf = mmap.mmap(-1, IO_BLOCK_SIZE)
+    try:
+      buf_ref = ctypes.c_char.from_buffer(buf)
+      try:
+        return _uring_run(lib, fd, write, setup_flags, ctypes.addressof(buf_ref))
+      finally:
+        del buf_ref
+    finally:
+      buf.close()
+  finally:
+    os.close(fd)
+
+
+def _uring_run(lib, fd, write, setup_flags, buf_addr):
+  """リングをセットアップして buf_addr のバッファでシーケンシャル I/O を行う"""
+  ring = ctypes.create_string_buffer(_IO_URING_STRUCT_SIZE)
+  params = _IoUringParams()
+  params.flags = setup_flags
+  params.sq_thread_idle = IO_URING_SQ_THREAD_IDLE_MS
+  ret = lib.io_uring_queue_init_params(IO_URING_ENTRIES, ring, ctypes.byref(params))
+  if ret < 0:
+    raise UringSetupError(-ret, f"io_uring_queue_init_params: {os.strerror(-ret)}")
+
+  try:
+    # バッファを事前に登録しておけば SQE ごとのページのピン留めが不要になる
+    # (RLIMIT_MEMLOCK などで登録できない場合は通常の read/write を使う)
+    iov = _Iovec(buf_addr, IO_BLOCK_SIZE)
+    if lib.io_uring_register_buffers(ring, ctypes.byref(iov), 1) == 0:
+      prep = lib.io_uring_prep_write_fixed if write else lib.io_uring_prep_read_fixed
+      prep_args = (0,)  # 登録したバッファのインデックス
+      buffer_mode = 'fixed buffers'
+    else:
+      prep = lib.io_uring_prep_write if write else lib.io_uring_prep_read
+      prep_args = ()
+      buffer_mode = 'unregistered buffers'
+
+    cqe = ctypes.POINTER(_IoUringCqe)()
+    cqes = (ctypes.POINTER(_IoUringCqe) * IO_URING_QUEUE_DEPTH)()
+    prepared = 0   # SQ に積んだ SQE の数
+    submitted = 0  # カーネルに投入した SQE の数
+    completed = 0
+    total_bytes = 0
+    error = None
+
+    start = time.monotonic_ns()
+    while True:
+      if error is None:
+        # キュー深さ IO_URING_QUEUE_DEPTH まで SQE を積んでまとめて投入する
+        while prepared - completed < IO_URING_QUEUE_DEPTH and prepared < IO_BLOCK_COUNT:
+          sqe = lib.io_uring_get_sqe(ring)
+          if not sqe:
+            break
+          prep(sqe, fd, buf_addr, IO_BLOCK_SIZE, prepared * IO_BLOCK_SIZE, *prep_args)
+          prepared += 1
+        if prepared > submitted:
+          ret = lib.io_uring_submit(ring)
+          if ret < 0:
+            error = OSError(-ret, f"io_uring_submit: {os.strerror(-ret)}")
+          else:
+            submitted += ret
+
+      # エラー後は新たに投入せず、投入済みの I/O がすべて完了するまで待つ
+      # (実行中の I/O を残したままにすると次の測定と重なってしまう)
+      if completed == submitted:
+        if error is not None or completed == IO_BLOCK_COUNT:
+          break
+        continue
+
+      # 完了を待ち、その時点で届いている CQE をまとめて刈り取る
+      ret = lib.io_uring_wait_cqe_nr(ring, ctypes.byref(cqe), 1)
+      if ret < 0:
+        raise OSError(-ret, f"io_uring_wait_cqe_nr: {os.strerror(-ret)}")
+      count = lib.io_uring_peek_batch_cqe(ring, cqes, IO_URING_QUEUE_DEPTH)
+      results = [cqes[i].contents.res for i in range(count)]
+      lib.io_uring_cq_advance(ring, count)
+      for res in results:
+        if res < 0:
+          if error is None:
+            error = UringCqeError(-res, f"io_uring I/O: {os.strerror(-res)}")
+        else:
+          total_bytes += res
+      completed += count
+    elapsed_ns = time.monotonic_ns() - start
+    if error is not None:
+      raise error
+  finally:
+    lib.io_uring_queue_exit(ring)
+
+  return total_bytes * 1e9 / elapsed_ns, buffer_mode
+
+
+def measure_sequential_io_dd(test_file):
+  """ddでシーケンシャルI/O性能を測定"""
+  perf_info = {}
+  
+  # 書き込み速度測定（1GBファイル）
+  print("Measuring write performance...")
+  write_cmd = f"dd if=/dev/zero of={test_file} bs=1M count=1024 oflag=direct 2>&1"
+  write_output = run_command(write_cmd, shell=True)
+  
+  if write_output:
+    # ddの出力から速度を抽出
+    speed_match = re.search(r'(\d+(?:\.\d+)?)\s*([KMGT]?B)/s', write_output)
+    if speed_match:
+      speed_value = float(speed_match.group(1))
+      speed_unit = speed_match.group(2)
+      perf_info['write_speed'] = f"{speed_value} {speed_unit}/s"
+  
+  # ファイルが作成されていることを確認
+  if os.path.exists(test_file):
+    # 読み込み速度測定
+    print("Measuring read performance...")
+    read_cmd = f"dd if={test_file} of=/dev/null bs=1M iflag=direct 2>&1"
+    read_output = run_command(read_cmd, shell=True)
+    
+    if read_output:
+      speed_match = re.search(r'(\d+(?:\.\d+)?)\s*([KMGT]?B)/s', read_output)
+      if speed_match:
+        speed_value = float(speed_match.group(1))
+        speed_unit = speed_match.group(2)
+        perf_info['read_speed'] = f"{speed_value} {speed_unit}/s"
+    
+    # テストファイルを削除
+    os.remove(test_file)
+  
+  return perf_info
+
+
 def measure_io_performance(target_dir):
   """I/O性能を測定"""
   perf_info = {}
@@ -190,35 +460,41 @@ def measure_io_performance(target_dir):
   try:
     test_file = os.path.join(target_dir, 'benchmark_io_test.tmp')
     
-    # 書き込み速度測定（1GBファイル）
-    print("Measuring write performance...")
-    write_cmd = f"dd if=/dev/zero of={test_file} bs=1M count=1024 oflag=direct 2>&1"
-    write_output = run_command(write_cmd, shell=True)
-    
-    if write_output:
-      # ddの出力から速度を抽出
-      speed_match = re.search(r'(\d+(?:\.\d+)?)\s*([KMGT]?B)/s', write_output)
-      if speed_match:
-        speed_value = float(speed_match.group(1))
-        speed_unit = speed_match.group(2)
-        perf_info['write_speed'] = f"{speed_value} {speed_unit}/s"
-    
-    # ファイルが作成されていることを確認
-    if os.path.exists(test_file):
-      # 読み込み速度測定
-      print("Measuring read performance...")
-      read_cmd = f"dd if={test_file} of=/dev/null bs=1M iflag=direct 2>&1"
-      read_output = run_command(read_cmd, shell=True)
-      
-      if read_output:
-        speed_match = re.search(r'(\d+(?:\.\d+)?)\s*([KMGT]?B)/s', read_output)
-        if speed_match:
-          speed_value = float(speed_match.group(1))
-          speed_unit = speed_match.group(2)
-          perf_info['read_speed'] = f"{speed_value} {speed_unit}/s"
-      
-      # テストファイルを削除
-      os.remove(test_file)
+    try:
+      liburing = load_liburing()
+      if liburing:
+        try:
+          # 書き込み速度測定（1GBファイル）
+          print("Measuring write performance with io_uring...")
+          write_speed, write_mode = uring_sequential_io(liburing, test_file, write=True)
+          perf_info['write_speed'] = f"{write_speed / 1e6:.1f} MB/s"
+
+          # 読み込み速度測定
+          print("Measuring read performance with io_uring...")
+          read_speed, read_mode = uring_sequential_io(liburing, test_file, write=False)
+          perf_info['read_speed'] = f"{read_speed / 1e6:.1f} MB/s"
+          if write_mode == read_mode:
+            perf_info['seq_io_method'] = f"io_uring (O_DIRECT, {write_mode})"
+          else:
+            perf_info['seq_io_method'] = f"io_uring (O_DIRECT; write: {write_mode}; read: {read_mode})"
+        except UringSetupError as e:
+          # カーネルが io_uring を拒否した場合（seccomp, io_uring_disabled, gVisor など）は dd で測定する
+          print(f"io_uring is not available ({e}), falling back to dd...")
+          liburing = None
+        except OSError as e:
+          # O_DIRECT 非対応のファイルシステムや I/O エラーなど。dd で測定し直す
+          print(f"io_uring measurement failed ({e}), falling back to dd...")
+          perf_info.pop('write_speed', None)
+          liburing = None
+
+      if not liburing:
+        # liburing が無い環境では dd で測定する
+        perf_info.update(measure_sequential_io_dd(test_file))
+        perf_info['seq_io_method'] = 'dd (oflag=direct)'
+    finally:
+      # 測定に失敗した場合も含めてテストファイルを削除
+      if os.path.exists(test_file):
+        os.remove(test_file)
     
     # ランダムI/O測定（fioがあれば）
     fio_output = run_command(['fio', '--version'])
@@ -682,6 +958,8 @@ def create_markdown_report(target_dir, storage_info, io_perf, cpu_info, memory_i
     
     # I/O性能
     f.write("## I/O Performance\n\n")
+    if io_perf.get('seq_io_method'):
+      f.write(f"- **Sequential I/O Method:** {io_perf['seq_io_method']}\n")
     if io_perf.get('write_speed'):
       f.write(f"- **Sequential Write Speed:** {io_perf['write_speed']}\n")
     if io_perf.get('read_speed'):
@@ -721,31 +999,36 @@ def main():
   print(f"Collecting environment information for: {target_dir}")
   print("This may take a few minutes due to I/O performance measurements...")
   
-  # 各種情報を収集
-  print("Collecting storage information...")
-  storage_info = get_storage_info(target_dir)
+  # 各種情報を並行して収集（いずれもサブプロセスやネットワークの応答待ちが主なのでスレッドで重ねる）
+  print("Collecting storage, CPU, memory, system, cloud and network information...")
+  collectors = {
+    'storage': lambda: get_storage_info(target_dir),
+    'cpu': get_cpu_info,
+    'memory': get_memory_info,
+    'system': get_system_info,
+    'cloud': get_cloud_instance_info,
+    'ip': get_public_ip_info,
+    'network': detect_cloud_from_network,
+  }
+  results = {}
+  with ThreadPoolExecutor(max_workers=8) as executor:
+    futures = {executor.submit(collector): name for name, collector in collectors.items()}
+    for future in as_completed(futures):
+      name = futures[future]
+      results[name] = future.result()
+      print(f"  {name} information collected")
+  storage_info = results['storage']
+  cpu_info = results['cpu']
+  memory_info = results['memory']
+  system_info = results['system']
+  cloud_info = results['cloud']
+  ip_info = results['ip']
+  network_hints = results['network']
   
+  # I/O性能は他の処理の影響を受けないよう、収集が終わってから単独で測定する
   print("Measuring I/O performance...")
   io_perf = measure_io_performance(target_dir)
   
-  print("Collecting CPU information...")
-  cpu_info = get_cpu_info()
-  
-  print("Collecting memory information...")
-  memory_info = get_memory_info()
-  
-  print("Collecting system information...")
-  system_info = get_system_info()
-  
-  print("Detecting cloud provider...")
-  cloud_info = get_cloud_instance_info()
-  
-  print("Collecting public IP information...")
-  ip_info = get_public_ip_info()
-  
-  print("Analyzing network configuration...")
-  network_hints = detect_cloud_from_network()
-  
   print("Generating report...")
   report_path = create_markdown_report(
     target_dir, storage_info, io_perf, cpu_info, 